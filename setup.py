@@ -0,0 +1,18 @@
+"""Build script for glosilo.
+
+All metadata lives in pyproject.toml. This file only exists to optionally compile
+the stemmer with mypyc: set GLOSILO_USE_MYPYC=1 when building (with mypy installed,
+e.g. ``pip install --no-build-isolation``) to ship glosilo.eostem as a C extension.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("GLOSILO_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/glosilo/eostem.py"])
+
+setup(ext_modules=ext_modules)
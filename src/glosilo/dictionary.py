@@ -8,6 +8,10 @@ from glosilo import consts
 from glosilo import eostem
 from glosilo import structs
 
+# Vortetoj whose preferred definition doubles as the core definition. Except for
+# ĉiel, which is easily confused with ĉielo.
+_CORE_DEFINITION_VORTETOJ: frozenset[str] = frozenset(consts.VORTETOJ - {"ĉiel"})
+
 
 class Dictionary:
     """The dictionary class."""
@@ -78,7 +82,7 @@ class Dictionary:
             core_str = core_to_str(analysis.core)
             if (
                 len(analysis.core) == 1
-                and analysis.core[0] in (consts.VORTETOJ - {"ĉiel"})
+                and analysis.core[0] in _CORE_DEFINITION_VORTETOJ
                 and core_str in self.words
             ):
                 analysis.core_definition = self.words[core_str].preferred_definition
@@ -5,7 +5,16 @@ prefixes, suffixes, and endings to find the core/root of a word.
 """
 
 from importlib.resources import files
+import functools
 import json
+import operator
+import sys
+from typing import Iterable
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to json.
+    orjson = None  # type: ignore[assignment]
 
 from glosilo import consts
 from glosilo import structs
@@ -15,12 +24,128 @@ DEBUGWORD = ""
 RAD_DICTIONARY_FILE = "rad_dictionary.json"
 KAP_DICTIONARY_FILE = "kap_dictionary.json"
 
+# Linking vowels allowed between compound parts, and grammatical endings.
+_VOWELS_AEIO: frozenset[str] = frozenset("aeio")
+_VOWELS_AEIOU: frozenset[str] = frozenset("aeiou")
+# The only suffixes that "ne" takes as a root ("neig", "neul"); everywhere else it
+# is the prefix.
+_NE_ROOT_SUFFIXES: frozenset[str] = frozenset(("ig", "ul"))
+# Most analyses a Stemmer memoizes in core_word. A shared Stemmer (as in the MCP
+# server) lives as long as the process, so the cache is cleared once it is full.
+_CORE_WORD_CACHE_SIZE = 65536
+# Likewise for the compound splits memoized by _try_split_compound, which also
+# include the fragments tried while splitting.
+_COMPOUND_CACHE_SIZE = 8192
+
+
+def _build_trie(affixes: Iterable[str], reverse: bool = False) -> dict:
+    """Builds a character trie of affixes.
+
+    Each node maps a character to its child node. The "" key marks a node that
+    ends an affix and holds that affix.
+
+    Args:
+        affixes: The affixes to add
+        reverse: Whether to add the affixes back to front, for suffix matching
+
+    Returns:
+        The root node of the trie
+    """
+    root: dict = {}
+    for affix in affixes:
+        node = root
+        for char in reversed(affix) if reverse else affix:
+            node = node.setdefault(char, {})
+        node[""] = affix
+    return root
+
+
+def _longest_match(trie: dict, chars: Iterable[str]) -> str | None:
+    """Walks a trie along chars and returns the longest affix reached, if any."""
+    node = trie
+    match = None
+    for char in chars:
+        child = node.get(char)
+        if child is None:
+            break
+        node = child
+        match = node.get("", match)
+    return match
+
+
+# Affix tries for the stripping loops. The longest matching affix wins, which is
+# what the longest-first preposition scan did; no prefix or suffix is itself the
+# start (or end) of another, so they have at most one match anyway.
+_PREFIX_TRIE: dict = _build_trie(consts.PREFIXES)
+_SUFFIX_TRIE: dict = _build_trie(consts.SUFFIXES, reverse=True)
+_PREPOSITION_TRIE: dict = _build_trie(consts.PREPOSITIONS)
+# A compound must consist of ROOTS, not affixes.
+_ALL_AFFIXES: frozenset[str] = frozenset(
+    set(consts.PREFIXES) | set(consts.SUFFIXES) | consts.PREPOSITIONS
+)
+
+
+def _root_bounds(
+    prefixes: list[str], suffixes: list[str], word: str
+) -> tuple[list[int], list[int]]:
+    """Computes where a root starts and ends in a word as affixes are added back.
+
+    Args:
+        prefixes: The prefixes stripped from the front of word, in order
+        suffixes: The suffixes stripped from the end of word, in order
+        word: The word the affixes were stripped from
+
+    Returns:
+        Tuple of (starts, ends) where starts[k] is the start of the root when the
+        last k prefixes are kept in it, and ends[m] is the end of the root when
+        the first m suffixes are kept in it.
+    """
+    starts = [0]
+    for prefix in prefixes:
+        starts.append(starts[-1] + len(prefix))
+    starts.reverse()
+
+    ends = [len(word)]
+    for suffix in reversed(suffixes):
+        ends.append(ends[-1] - len(suffix))
+    ends.reverse()
+    return starts, ends
+
+
+@functools.cache
+def _load_dictionary(filename: str) -> dict[str, str]:
+    """Loads a dictionary from the package data, once per process.
+
+    Every Stemmer shares the result, so it must not be modified.
+
+    Args:
+        filename: The name of the JSON file in glosilo.data
+
+    Returns:
+        The dictionary, with interned keys and values
+    """
+    raw = files("glosilo.data").joinpath(filename).read_bytes()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    # Interned keys let lookups of interned query strings match on identity. The
+    # values are article ids, which repeat across many keys (and across both
+    # dictionaries), so interning them stores each id once.
+    return {sys.intern(k): sys.intern(v) for k, v in data.items()}
+
 
 class Stemmer:
     """Stemmer utility."""
 
     _rad_dictionary_cache: dict[str, str]
     _kap_dictionary_cache: dict[str, str]
+    # Memoized compound splits, keyed by word. Only valid for the currently
+    # loaded rad dictionary. Holds at most _COMPOUND_CACHE_SIZE entries.
+    _compound_cache: dict[str, tuple[str, ...] | None]
+    # Memoized core_word analyses (prefixes, core, suffixes, ending), keyed by
+    # lowercased word. Only valid for the currently loaded rad dictionary. Holds at
+    # most _CORE_WORD_CACHE_SIZE entries.
+    _core_word_cache: dict[
+        str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], str]
+    ]
 
     def __init__(self):
         self._load_rad_dictionary()
@@ -32,11 +157,9 @@ class Stemmer:
         Raises:
 
         """
-        self._rad_dictionary_cache = json.loads(
-            files("glosilo.data")
-            .joinpath(RAD_DICTIONARY_FILE)
-            .read_text(encoding="utf-8")
-        )
+        self._rad_dictionary_cache = _load_dictionary(RAD_DICTIONARY_FILE)
+        self._compound_cache = {}
+        self._core_word_cache = {}
 
     def get_rad_dictionary(self) -> dict[str, str]:
         """Returns the rad dictionary."""
@@ -48,11 +171,7 @@ class Stemmer:
         Raises:
 
         """
-        self._kap_dictionary_cache = json.loads(
-            files("glosilo.data")
-            .joinpath(KAP_DICTIONARY_FILE)
-            .read_text(encoding="utf-8")
-        )
+        self._kap_dictionary_cache = _load_dictionary(KAP_DICTIONARY_FILE)
 
     def get_kap_dictionary(self) -> dict[str, str]:
         """Returns the kap dictionary."""
@@ -111,9 +230,25 @@ class Stemmer:
             return parts
         return [parts]
 
-    def _try_split_compound(
-        self, word: str, rad_dict: dict[str, str]
-    ) -> list[str] | None:
+    def _try_split_compound(self, word: str) -> list[str] | None:
+        """Try to split a word into compound parts, memoizing the result.
+
+        Args:
+            word: The word to attempt to split
+
+        Returns:
+            List of core parts if valid compound found, None otherwise
+        """
+        try:
+            split = self._compound_cache[word]
+        except KeyError:
+            split = self._split_compound(word)
+            if len(self._compound_cache) >= _COMPOUND_CACHE_SIZE:
+                self._compound_cache.clear()
+            self._compound_cache[word] = split
+        return list(split) if split else None
+
+    def _split_compound(self, word: str) -> tuple[str, ...] | None:
         """Try to split a word into compound parts.
 
         Algorithm:
@@ -125,10 +260,9 @@ class Stemmer:
 
         Args:
             word: The word to attempt to split
-            rad_dict: Root dictionary for validation
 
         Returns:
-            List of core parts if valid compound found, None otherwise
+            Tuple of core parts if valid compound found, None otherwise
 
         Examples:
             bluokul -> ['blu', 'okul'] (no linking vowel, okul starts with o)
@@ -140,11 +274,10 @@ class Stemmer:
         if len(word) < 4:
             return None
 
+        rad_dict = self._rad_dictionary_cache
+
         # Get all affixes to exclude them from compound parts
-        # A compound must consist of ROOTS, not affixes
-        all_affixes = (
-            set(consts.PREFIXES) | set(consts.SUFFIXES) | set(consts.PREPOSITIONS)
-        )
+        all_affixes = _ALL_AFFIXES
 
         best_split = None
         best_score = 0  # Score based on root lengths
@@ -168,7 +301,7 @@ class Stemmer:
                     best_split = [left_part, right_part]
 
             # Try with linking vowel (check if left ends with a/e/i/o)
-            if left_part and left_part[-1] in "aeio":
+            if left_part and left_part[-1] in _VOWELS_AEIO:
                 left_root = left_part[:-1]
                 linking_vowel = left_part[-1]
                 # Both parts must be in rad_dict AND not be affixes
@@ -187,7 +320,7 @@ class Stemmer:
         # Only use the recursive split if it provides more total root length
         if best_split and len(best_split) == 2:
             right_part_original_len = len(best_split[1])
-            right_subsplit = self._try_split_compound(best_split[1], rad_dict)
+            right_subsplit = self._try_split_compound(best_split[1])
             if right_subsplit:
                 # Only use recursive split if total root length is greater
                 right_subsplit_len = sum(len(p) for p in right_subsplit if len(p) > 1)
@@ -196,14 +329,47 @@ class Stemmer:
         elif best_split and len(best_split) == 3:
             # Has linking vowel - try recursive split on right part
             right_part_original_len = len(best_split[2])
-            right_subsplit = self._try_split_compound(best_split[2], rad_dict)
+            right_subsplit = self._try_split_compound(best_split[2])
             if right_subsplit:
                 # Only use recursive split if total root length is greater
                 right_subsplit_len = sum(len(p) for p in right_subsplit if len(p) > 1)
                 if right_subsplit_len > right_part_original_len:
                     best_split = [best_split[0], best_split[1]] + right_subsplit
 
-        return best_split
+        return tuple(best_split) if best_split else None
+
+    def _strip_prefixes(self, word: str) -> tuple[str, list[str]]:
+        """Repeatedly strips the first matching prefix from the front of a word.
+
+        Args:
+            word: The word to strip
+
+        Returns:
+            Tuple of (remainder, prefixes) where prefixes are in the order they
+            appeared in the word.
+        """
+        prefixes: list[str] = []
+        while prefix := _longest_match(_PREFIX_TRIE, word):
+            prefixes.append(prefix)
+            word = word[len(prefix) :]
+        return word, prefixes
+
+    def _strip_suffixes(self, word: str) -> tuple[str, list[str]]:
+        """Repeatedly strips the first matching suffix from the end of a word.
+
+        Args:
+            word: The word to strip
+
+        Returns:
+            Tuple of (remainder, suffixes) where suffixes are in the order they
+            appeared in the word.
+        """
+        suffixes: list[str] = []
+        while suffix := _longest_match(_SUFFIX_TRIE, reversed(word)):
+            suffixes.append(suffix)
+            word = word[: -len(suffix)]
+        suffixes.reverse()
+        return word, suffixes
 
     def _strip_affixes2(
         self, word_without_ending: str
@@ -211,6 +377,7 @@ class Stemmer:
         """Alternative algorithm for stripping affixes using iterative reconstruction.
 
         This algorithm:
+        0. Returns the word as-is if it is already a root in rad_dict
         0.5. Try compound word splitting on the original word FIRST
         1. Strips one preposition from the beginning (if possible)
         2. Strips all prefixes from the remainder
@@ -230,79 +397,64 @@ class Stemmer:
         """
         rad_dict = self._rad_dictionary_cache
 
+        # Step 0: A word that is itself a root can't be beaten by any deconstruction:
+        # it has the longest possible root and no penalty. The only exception is the
+        # boosted "ne"+ig/ul special case below, so let those words go the long way.
+        if word_without_ending in rad_dict and not word_without_ending.endswith(
+            ("neig", "neul")
+        ):
+            return [word_without_ending], [], []
+
         # Step 1: Try to strip one preposition from the beginning
-        preposition: str | None = None
+        # The trie's top level holds every preposition's first letter, so words that
+        # can't start with a preposition skip the walk.
+        preposition = None
+        if word_without_ending[:1] in _PREPOSITION_TRIE:
+            preposition = _longest_match(_PREPOSITION_TRIE, word_without_ending)
         remainder = word_without_ending
+        if preposition:
+            remainder = word_without_ending[len(preposition) :]
 
-        for prep in sorted(consts.PREPOSITIONS, key=len, reverse=True):
-            if word_without_ending.startswith(prep):
-                preposition = prep
-                remainder = word_without_ending[len(prep) :]
-                break
+        unprepped = remainder
 
         # Step 2: Strip all prefixes from the remainder
-        temp_prefixes: list[str] = []
-        while True:
-            found_prefix = False
-            for prefix in consts.PREFIXES:
-                if remainder.startswith(prefix):
-                    temp_prefixes.append(prefix)
-                    remainder = remainder[len(prefix) :]
-                    found_prefix = True
-                    break
-            if not found_prefix:
-                break
+        remainder, temp_prefixes = self._strip_prefixes(remainder)
 
         # Step 3: Strip all suffixes from what's left
-        temp_suffixes: list[str] = []
-        while True:
-            found_suffix = False
-            for suffix in consts.SUFFIXES:
-                if remainder.endswith(suffix):
-                    temp_suffixes.insert(0, suffix)
-                    remainder = remainder[: -len(suffix)]
-                    found_suffix = True
-                    break
-            if not found_suffix:
-                break
+        remainder, temp_suffixes = self._strip_suffixes(remainder)
 
         # Now remainder is the core after maximum stripping
         # temp_prefixes contains all stripped prefixes
         # temp_suffixes contains all stripped suffixes
 
+        # Nothing was stripped, and step 0 showed the word isn't a root, so every
+        # deconstruction below would be the same compound split of the whole word.
+        if not preposition and not temp_prefixes and not temp_suffixes:
+            compound_parts = self._try_split_compound(word_without_ending)
+            if compound_parts:
+                return compound_parts, [], []
+            return self.make_core(word_without_ending), [], []
+
         # Step 4 & 5: Iterate through all combinations, reconstruct roots, and validate
         # We'll also consider compound splits as one of the possibilities
-        deconstructions: list[tuple[list[str], list[str], list[str], int, int]] = []
+        # (rank, prefixes, core, suffixes); rank is (-penalty, score, affix count)
+        deconstructions: list[
+            tuple[tuple[int, int, int], list[str], list[str], list[str]]
+        ] = []
 
         # IMPORTANT: Also try without the preposition stripped!
         # This handles cases like "dezert" where "de" looks like a preposition
         # but "dezert" is actually a complete root
-        no_prep_remainder = word_without_ending
-        no_prep_temp_prefixes: list[str] = []
-        no_prep_temp_suffixes: list[str] = []
-
-        # Strip prefixes and suffixes from the word without preposition stripping
-        while True:
-            found_prefix = False
-            for prefix in consts.PREFIXES:
-                if no_prep_remainder.startswith(prefix):
-                    no_prep_temp_prefixes.append(prefix)
-                    no_prep_remainder = no_prep_remainder[len(prefix) :]
-                    found_prefix = True
-                    break
-            if not found_prefix:
-                break
-
-        while True:
-            found_suffix = False
-            for suffix in consts.SUFFIXES:
-                if no_prep_remainder.endswith(suffix):
-                    no_prep_temp_suffixes.insert(0, suffix)
-                    no_prep_remainder = no_prep_remainder[: -len(suffix)]
-                    found_suffix = True
-                    break
-            if not found_suffix:
-                break
+        no_prep_remainder, no_prep_temp_prefixes = self._strip_prefixes(
+            word_without_ending
+        )
+        no_prep_remainder, no_prep_temp_suffixes = self._strip_suffixes(
+            no_prep_remainder
+        )
+
+        # Every reconstructed root is a contiguous slice of the word after the
+        # preposition, so precompute where each kept prefix/suffix starts.
+        root_starts, root_ends = _root_bounds(temp_prefixes, temp_suffixes, unprepped)
 
         # Try all combinations of how many prefixes/suffixes to "unstri" (add back to core)
         for num_prefixes_to_keep_in_core in range(len(temp_prefixes) + 1):
@@ -310,29 +462,17 @@ class Stemmer:
                 # Reconstruct the root
                 # Prefixes that go back into core: last num_prefixes_to_keep_in_core
                 # Suffixes that go back into core: first num_suffixes_to_keep_in_core
-                reconstructed_root_parts: list[str] = []
-
-                if num_prefixes_to_keep_in_core > 0:
-                    reconstructed_root_parts.extend(
-                        temp_prefixes[-num_prefixes_to_keep_in_core:]
-                    )
-
-                reconstructed_root_parts.append(remainder)
-
-                if num_suffixes_to_keep_in_core > 0:
-                    reconstructed_root_parts.extend(
-                        temp_suffixes[:num_suffixes_to_keep_in_core]
-                    )
-
-                reconstructed_root = "".join(reconstructed_root_parts)
+                reconstructed_root = unprepped[
+                    root_starts[num_prefixes_to_keep_in_core] : root_ends[
+                        num_suffixes_to_keep_in_core
+                    ]
+                ]
 
                 # Check if this root is valid, or if it can be split into compound parts
                 compound_parts = None
                 if reconstructed_root not in rad_dict:
                     # Try compound splitting
-                    compound_parts = self._try_split_compound(
-                        reconstructed_root, rad_dict
-                    )
+                    compound_parts = self._try_split_compound(reconstructed_root)
 
                 if reconstructed_root in rad_dict or compound_parts:
                     # This is a valid configuration
@@ -365,10 +505,10 @@ class Stemmer:
                         # have "ebl" and "ind" as core
                         if reconstructed_root == "ne" and stripped_suffixes:
                             # If "ne" is the core and there are suffixes, check if they're ig/ul only
-                            if len(stripped_suffixes) == 1 and stripped_suffixes[0] in [
-                                "ig",
-                                "ul",
-                            ]:
+                            if (
+                                len(stripped_suffixes) == 1
+                                and stripped_suffixes[0] in _NE_ROOT_SUFFIXES
+                            ):
                                 # Boost this configuration (negative penalty = higher priority)
                                 score_penalty = -1000
                             else:
@@ -377,47 +517,41 @@ class Stemmer:
 
                         # Also penalize "ig" or "ul" as cores when "ne" is a prefix
                         if (
-                            reconstructed_root in ["ig", "ul"]
+                            reconstructed_root in _NE_ROOT_SUFFIXES
                             and "ne" in stripped_prefixes
                         ):
                             score_penalty = 1000
 
                     deconstructions.append(
                         (
+                            (
+                                -score_penalty,
+                                score,
+                                len(stripped_prefixes) + len(stripped_suffixes),
+                            ),
                             stripped_prefixes,
                             core_to_use,
                             stripped_suffixes,
-                            score,
-                            score_penalty,
                         )
                     )
 
         # Also try all combinations WITHOUT the preposition stripped
+        root_starts, root_ends = _root_bounds(
+            no_prep_temp_prefixes, no_prep_temp_suffixes, word_without_ending
+        )
         for num_prefixes_to_keep_in_core in range(len(no_prep_temp_prefixes) + 1):
             for num_suffixes_to_keep_in_core in range(len(no_prep_temp_suffixes) + 1):
-                reconstructed_root_parts = []
-
-                if num_prefixes_to_keep_in_core > 0:
-                    reconstructed_root_parts.extend(
-                        no_prep_temp_prefixes[-num_prefixes_to_keep_in_core:]
-                    )
-
-                reconstructed_root_parts.append(no_prep_remainder)
-
-                if num_suffixes_to_keep_in_core > 0:
-                    reconstructed_root_parts.extend(
-                        no_prep_temp_suffixes[:num_suffixes_to_keep_in_core]
-                    )
-
-                reconstructed_root = "".join(reconstructed_root_parts)
+                reconstructed_root = word_without_ending[
+                    root_starts[num_prefixes_to_keep_in_core] : root_ends[
+                        num_suffixes_to_keep_in_core
+                    ]
+                ]
 
                 # Check if this root is valid, or if it can be split into compound parts
                 compound_parts = None
                 if reconstructed_root not in rad_dict:
                     # Try compound splitting
-                    compound_parts = self._try_split_compound(
-                        reconstructed_root, rad_dict
-                    )
+                    compound_parts = self._try_split_compound(reconstructed_root)
 
                 if reconstructed_root in rad_dict or compound_parts:
                     stripped_prefixes = no_prep_temp_prefixes[
@@ -441,33 +575,36 @@ class Stemmer:
 
                         # No preposition in this case
                         if reconstructed_root == "ne" and stripped_suffixes:
-                            if len(stripped_suffixes) == 1 and stripped_suffixes[0] in [
-                                "ig",
-                                "ul",
-                            ]:
+                            if (
+                                len(stripped_suffixes) == 1
+                                and stripped_suffixes[0] in _NE_ROOT_SUFFIXES
+                            ):
                                 score_penalty = -1000
                             else:
                                 score_penalty = 1000
 
                         if (
-                            reconstructed_root in ["ig", "ul"]
+                            reconstructed_root in _NE_ROOT_SUFFIXES
                             and "ne" in stripped_prefixes
                         ):
                             score_penalty = 1000
 
                     deconstructions.append(
                         (
+                            (
+                                -score_penalty,
+                                score,
+                                len(stripped_prefixes) + len(stripped_suffixes),
+                            ),
                             stripped_prefixes,
                             core_to_use,
                             stripped_suffixes,
-                            score,
-                            score_penalty,
                         )
                     )
 
         # Step 5.5: Also try compound word splitting on various reconstructed forms
         # Try compound on the remainder (after max stripping)
-        compound_parts = self._try_split_compound(remainder, rad_dict)
+        compound_parts = self._try_split_compound(remainder)
         if compound_parts:
             all_prefixes = ([preposition] if preposition else []) + temp_prefixes
             # Calculate score for compound: sum of root lengths (excluding linking vowels)
@@ -477,18 +614,19 @@ class Stemmer:
             compound_penalty = 10
             deconstructions.append(
                 (
+                    (
+                        -compound_penalty,
+                        compound_score,
+                        len(all_prefixes) + len(temp_suffixes),
+                    ),
                     all_prefixes,
                     compound_parts,
                     temp_suffixes,
-                    compound_score,
-                    compound_penalty,
                 )
             )
 
         # Also try compound on the original word (before any stripping)
-        compound_parts_original = self._try_split_compound(
-            word_without_ending, rad_dict
-        )
+        compound_parts_original = self._try_split_compound(word_without_ending)
         if compound_parts_original:
             compound_score_original = sum(
                 len(p) for p in compound_parts_original if len(p) > 1
@@ -498,26 +636,23 @@ class Stemmer:
             compound_penalty_original = 5
             deconstructions.append(
                 (
+                    (-compound_penalty_original, compound_score_original, 0),
                     [],
                     compound_parts_original,
                     [],
-                    compound_score_original,
-                    compound_penalty_original,
                 )
             )
 
         # Step 6: Choose the element with the longest reconstructed root
         if deconstructions:
-            # Sort by penalty (ascending), then root length (descending), then affixes
-            # stripped (descending)
-            deconstructions.sort(
-                key=lambda x: (-x[4], x[3], len(x[0]) + len(x[2])), reverse=True
-            )
-            best = deconstructions[0]
+            # Rank by penalty (ascending), then root length (descending), then affixes
+            # stripped (descending). The rank tuple is built when each candidate is
+            # added, so max() only compares ints; ties go to the earliest candidate.
+            best = max(deconstructions, key=operator.itemgetter(0))
             return (
-                best[1],
-                best[0],
                 best[2],
+                best[1],
+                best[3],
             )  # core (already list[str]), prefixes, suffixes
 
         # Fallback: return with maximum stripping
@@ -536,11 +671,7 @@ class Stemmer:
 
     def _split_ending(self, word: str, debug: bool = False) -> tuple[str, str]:
         orig_ending = ""
-        if (
-            len(word) >= 2
-            and word[-1] in ["a", "e", "i", "o", "u"]
-            and word not in consts.VORTETOJ
-        ):
+        if len(word) >= 2 and word[-1] in _VOWELS_AEIOU and word not in consts.VORTETOJ:
             orig_ending = word[-1]
             word = word[:-1]
 
@@ -560,9 +691,59 @@ class Stemmer:
         return word
 
     def core_word(self, word: str, debug: bool = False) -> structs.CoredWord:
-        """Cores a word by removing all possible prefixes and suffixes."""
+        """Cores a word by removing all possible prefixes and suffixes.
+
+        The analysis only depends on the lowercased word, so it is memoized. Every
+        call still gets its own CoredWord, since callers fill in definitions.
+        """
         if debug:
             print(f"Coring {word}")
+        key = word.lower()
+        # Debug runs skip the cache so that the tracing prints always appear. A
+        # single get() (rather than "in" then indexing) stays correct if another
+        # caller clears the cache in between.
+        cached = None if debug or word == DEBUGWORD else self._core_word_cache.get(key)
+        if cached is None:
+            prefixes, core, suffixes, orig_ending = self._analyze_word(word, debug)
+            # Interned roots are the very objects keying the rad dictionary, so
+            # probing it with them (as verify_stem does) matches on identity.
+            cached = (
+                tuple(prefixes),
+                tuple(map(sys.intern, core)),
+                tuple(suffixes),
+                orig_ending,
+            )
+            if len(self._core_word_cache) >= _CORE_WORD_CACHE_SIZE:
+                self._core_word_cache.clear()
+            self._core_word_cache[key] = cached
+
+        analysis = structs.CoredWord(
+            word,
+            list(cached[0]),
+            list(cached[1]),
+            list(cached[2]),
+            cached[3],
+            [],
+            "",
+            "",
+        )
+        if debug:
+            print(f"  Cored: {analysis}")
+
+        return analysis
+
+    def _analyze_word(
+        self, word: str, debug: bool = False
+    ) -> tuple[list[str], list[str], list[str], str]:
+        """Splits a word into prefixes, core, suffixes and preferred ending.
+
+        Args:
+            word: The word to analyze, in its original case
+            debug: Whether to print debugging information
+
+        Returns:
+            Tuple of (prefixes, core, suffixes, preferred_ending)
+        """
         orig_word = word
         word = word.lower()
 
@@ -601,10 +782,10 @@ class Stemmer:
                 if orig_word == DEBUGWORD:
                     print(f"  No core, trying to use prefix {core[0]}")
 
-        analysis = structs.CoredWord(
-            orig_word, prefixes, core, suffixes, orig_ending, [], "", ""
-        )
-        if debug:
-            print(f"  Cored: {analysis}")
+        return prefixes, core, suffixes, orig_ending
 
-        return analysis
+    def core_words(
+        self, words: Iterable[str], debug: bool = False
+    ) -> list[structs.CoredWord]:
+        """Cores a batch of words. Equivalent to calling core_word on each word."""
+        return [self.core_word(word, debug) for word in words]
@@ -1,6 +1,6 @@
 """The main glosser."""
 
-import copy
+import dataclasses
 import io
 import pathlib
 import re
@@ -23,6 +23,33 @@ DEBUGWORD = "Ĉapman-domo" if DEBUG else ""
 WORDFILE = "text1.txt"
 OUTFILE = "gloss1.tex"
 
+_PUNCTUATION_RE = re.compile(consts.PUNCTUATION_REGEX)
+# Punctuation that merge_punctuation attaches to the following or preceding word.
+_OPENING_PUNCTUATION = frozenset("(“")
+_CLOSING_PUNCTUATION = frozenset(".,:;)”—!?")
+# Suffixes that adjust_gloss leaves for the reader to figure out, checked in order
+# from the last suffix inwards.
+_UNTRANSLATED_SUFFIXES: tuple[frozenset[str], ...] = (
+    frozenset({"at", "it", "ot", "ant", "int", "ont"}),
+    frozenset({"ig", "iĝ"}),
+    frozenset({"aĵ"}),
+    frozenset({"ad"}),
+    frozenset({"ebl"}),
+)
+
+
+def read_word_list(filename: str) -> dict[str, str]:
+    """Reads a "key: value" word list next to this module, skipping # comments."""
+    words: dict[str, str] = {}
+    path = pathlib.Path(__file__).parent / filename
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            key, value = line.split(":", 1)
+            words[key.strip()] = value.strip()
+    return words
+
 
 class Glosser:
     """Glosses a wordpile."""
@@ -34,25 +61,9 @@ class Glosser:
 
     def __init__(self, dictionary: Dictionary):
         self.dictionary = dictionary
-        self.difficult = {}
-        path = pathlib.Path(__file__).parent / consts.DIFFICULT_WORDLIST_FILE
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("#"):
-                    continue
-                key, value = line.split(":", 1)
-                self.difficult[key.strip()] = value.strip()
-
-        path = pathlib.Path(__file__).parent / consts.NAMELIST_FILE
-        self.names = {}
-        self.name_used = {}
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("#"):
-                    continue
-                key, value = line.split(":", 1)
-                self.names[key.strip()] = value.strip()
-                self.name_used[key.strip()] = False
+        self.difficult = read_word_list(consts.DIFFICULT_WORDLIST_FILE)
+        self.names = read_word_list(consts.NAMELIST_FILE)
+        self.name_used = dict.fromkeys(self.names, False)
 
     def handle_name(self, g: structs.CoredWord) -> None:
         if g.orig_word in self.names:
@@ -72,8 +83,8 @@ class Glosser:
         if DEBUG:
             print("==============================")
 
-        # Make a copy of the gloss from the dictionary because we will be modifying them
-        # for punctuation.
+        # The glosses from the dictionary are our own copies, because we will be
+        # modifying them for punctuation.
         glosses: list[structs.CoredWord] = []
         for word in words_to_gloss(wordpile):
             g = get_dictionary_gloss(self.dictionary, word)
@@ -84,19 +95,20 @@ class Glosser:
                 self.handle_name(part)
         glosses = merge_punctuation(glosses)
 
-        print("\\section{}\n\\begingl%", file=fout)
-
+        # Build the whole paragraph and write it once.
+        lines = ["\\section{}\n\\begingl%"]
         for g in glosses:
-            line = hyphenated_gloss(self, g) if g.parts else single_part_gloss(self, g)
-            print(line, file=fout)
-
-        print("\\endgl%\n", file=fout)
+            lines.append(
+                hyphenated_gloss(self, g) if g.parts else single_part_gloss(self, g)
+            )
+        lines.append("\\endgl%\n\n")
+        fout.write("\n".join(lines))
 
 
 def words_to_gloss(words: str) -> Iterable[str]:
     """Yields individual words to gloss."""
     for word in words.split():
-        for part in re.split(consts.PUNCTUATION_REGEX, word):
+        for part in _PUNCTUATION_RE.split(word):
             if not part:
                 continue
             yield part
@@ -120,13 +132,15 @@ def merge_punctuation(glosses: list[structs.CoredWord]) -> list[structs.CoredWor
     for g in glosses:
         # If the last character in the previous word was in [(“] then prepend the
         # previous word to the current word and add the current word.
-        if punctuated_glosses and punctuated_glosses[-1].orig_word[-1] in "(“":
-            orig_word = punctuated_glosses[-1].orig_word
-            punctuated_glosses[-1] = copy.copy(g)
-            punctuated_glosses[-1].orig_word = orig_word + g.orig_word
-            continue
+        if punctuated_glosses:
+            previous = punctuated_glosses[-1]
+            if previous.orig_word[-1] in _OPENING_PUNCTUATION:
+                punctuated_glosses[-1] = dataclasses.replace(
+                    g, orig_word=previous.orig_word + g.orig_word
+                )
+                continue
 
-        if g.orig_word not in ".,:;)”—!?":
+        if g.orig_word not in _CLOSING_PUNCTUATION:
             punctuated_glosses.append(g)
             continue
 
@@ -146,7 +160,9 @@ def get_dictionary_gloss(dictionary: Dictionary, word: str) -> structs.CoredWord
         and not analysis.suffixes
     ):
         return structs.CoredWord(word, [], [""], [], "", [], "", "")
-    return copy.copy(analysis)
+    # Dictionary.get_gloss already returns a fresh CoredWord, so the caller can
+    # modify it without touching the saved gloss.
+    return analysis
 
 
 def adjust_gloss(glosser: Glosser, g: structs.CoredWord) -> structs.CoredWord:
@@ -161,72 +177,28 @@ def adjust_gloss(glosser: Glosser, g: structs.CoredWord) -> structs.CoredWord:
         return g
 
     last_suffix = 1
-    first_prefix = 0
-
-    # Do not translate particles, let the reader figure them out.
-    if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] in [
-        "at",
-        "it",
-        "ot",
-        "ant",
-        "int",
-        "ont",
-    ]:
-        suf = g.suffixes[-last_suffix]
-        rip = len(suf) + 1
-        word = word[:-rip] + "i"
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
-        g.preferred_definition = ""
-        last_suffix += 1
-
-    # Do not translate ig/iĝ, let the reader figure it out.
-    if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] in ["ig", "iĝ"]:
-        suf = g.suffixes[-last_suffix]
-        rip = len(suf) + 1
-        word = word[:-rip] + "i"
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
-        g.preferred_definition = ""
-        last_suffix += 1
-
-    # Do not translate aĵ, let the reader figure it out.
-    if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] == "aĵ":
-        suf = g.suffixes[-last_suffix]
-        rip = len(suf) + 1
-        word = word[:-rip] + word[-1]
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
-        g.preferred_definition = ""
-        last_suffix += 1
-
-    # Do not translate ad, let the reader figure it out.
-    if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] == "ad":
-        suf = g.suffixes[-last_suffix]
-        rip = len(suf) + 1
-        word = word[:-rip] + "i"
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
-        g.preferred_definition = ""
-        last_suffix += 1
-
-    # Do not translate ebl, let the reader figure it out.
-    if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] == "ebl":
-        suf = g.suffixes[-last_suffix]
-        rip = len(suf) + 1
-        word = word[:-rip] + "i"
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
-        g.preferred_definition = ""
-        last_suffix += 1
+
+    # Do not translate these suffixes, let the reader figure them out.
+    for suffixes in _UNTRANSLATED_SUFFIXES:
+        if len(g.suffixes) >= last_suffix and g.suffixes[-last_suffix] in suffixes:
+            g.preferred_definition = ""
+            last_suffix += 1
 
     # Do not translate mal, let the reader figure it out.
-    if len(g.prefixes) > first_prefix and g.prefixes[first_prefix] == "mal":
-        pref = g.prefixes[first_prefix]
-        rip = len(pref)
-        word = word[rip:]
-        analysis = get_dictionary_gloss(glosser.dictionary, word)
+    if g.prefixes and g.prefixes[0] == "mal":
         g.preferred_definition = ""
-        first_prefix += 1
 
     return g
 
 
+def _format_entry(g: structs.CoredWord, definition: str) -> str:
+    """Formats a gloss entry, adding the preferred definition if it differs."""
+    if not g.preferred_definition or (g.core_definition == g.preferred_definition):
+        return f"{g.orig_word}[{definition}]"
+    preferred_definition = g.preferred_definition.replace("-", " ")
+    return f"{g.orig_word}[{definition}/{preferred_definition}]"
+
+
 def hyphenated_gloss(glosser: Glosser, g: structs.CoredWord) -> str:
     """Returns a formatted gloss for a hyphenated word."""
     if DEBUG:
@@ -236,10 +208,7 @@ def hyphenated_gloss(glosser: Glosser, g: structs.CoredWord) -> str:
     if "???" in definition:
         print(g)
 
-    if not g.preferred_definition or (g.core_definition == g.preferred_definition):
-        return f"{g.orig_word}[{definition}]"
-    preferred_definition = g.preferred_definition.replace("-", " ")
-    return f"{g.orig_word}[{definition}/{preferred_definition}]"
+    return _format_entry(g, definition)
 
 
 def core_gloss(glosser: Glosser, g: structs.CoredWord) -> str:
@@ -269,10 +238,7 @@ def single_part_gloss(glosser: Glosser, g: structs.CoredWord) -> str:
     # if g.preferred_definition == "???":
     #     return f"{g.orig_word}[???]"
 
-    if not g.preferred_definition or (g.core_definition == g.preferred_definition):
-        return f"{g.orig_word}[{definition}]"
-    preferred_definition = g.preferred_definition.replace("-", " ")
-    return f"{g.orig_word}[{definition}/{preferred_definition}]"
+    return _format_entry(g, definition)
 
 
 def run() -> None:
@@ -0,0 +1,34 @@
+"""JSON output shared by the glosilo command-line tools."""
+
+import io
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to json.
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(data: Any) -> str:
+    """Serializes data as indented JSON, keeping non-ASCII characters as-is."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def print_json(data: Any) -> None:
+    """Writes data to stdout as indented JSON (see dumps_json), then a newline."""
+    if orjson:
+        # orjson already produces UTF-8 bytes, so skip the text layer entirely.
+        # Flush it first, so anything already printed stays ahead of the JSON.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        return
+
+    # Ensure UTF-8 encoding for output on Windows
+    if sys.stdout.encoding != "utf-8":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    print(dumps_json(data))
@@ -9,21 +9,35 @@ Usage:
 """
 
 from dataclasses import dataclass
+import functools
 from importlib.resources import files
-import io
 import json
 import string
 import sys
 from typing import Any
 import zipfile
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to json.
+    orjson = None  # type: ignore[assignment]
+
 from glosilo import eostem
+from glosilo import jsonout
 from glosilo.structs import CoredWord
 
 JSONDATA_ZIP_FILE = "jsondata.zip"
 
+# Linking vowels, which appear as single-letter parts of compound cores.
+_LINKING_VOWELS = frozenset("aeio")
+# Common Esperanto endings to try, in order, when looking up a base word. The order
+# is a priority (e.g. -i before -o for verbal roots), not a frequency ranking.
+_LOOKUP_ENDINGS = ("", "i", "o", "a", "e", "as", "is", "os", "us", "u", "n", "j", "jn")
+# Returned by load_senses for missing articles. Shared, so never modify it.
+_NO_SENSES: dict[str, dict[str, str]] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class Definition:
     """Definition data for a single word or core morpheme.
 
@@ -39,7 +53,7 @@ class Definition:
     senses: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class LookupResult:
     """Result of looking up word definitions.
 
@@ -60,7 +74,7 @@ class LookupResult:
     definitions: list[Definition]
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Complete word analysis result with definitions.
 
@@ -83,7 +97,7 @@ class Result:
     lookup: LookupResult
 
 
-@dataclass
+@dataclass(slots=True)
 class Results:
     """Collection of word analysis results.
 
@@ -96,9 +110,20 @@ class Results:
     results: list[Result]
 
 
+@functools.cache
+def _open_jsondata_zip() -> zipfile.ZipFile:
+    """Opens jsondata.zip once per process, so its directory is only read once."""
+    return zipfile.ZipFile(files("glosilo.data").joinpath(JSONDATA_ZIP_FILE).open("rb"))
+
+
+@functools.cache
 def load_senses(article_id: str) -> dict[str, dict[str, str]]:
     """Load sense definitions from JSON file in jsondata.zip.
 
+    Results are cached per article, since one lookup often tries the same article
+    more than once. The cache is unbounded: the whole archive only takes about
+    20 MB once parsed. The returned dictionary is shared and must not be modified.
+
     Args:
         article_id: The article identifier (e.g., "parol", "kompren")
 
@@ -106,17 +131,14 @@ def load_senses(article_id: str) -> dict[str, dict[str, str]]:
         Dictionary mapping kap text to sense dictionaries
     """
     json_filename = f"jsondata/{article_id}.json"
-    zip_path = files("glosilo.data").joinpath(JSONDATA_ZIP_FILE)
-    with zip_path.open("rb") as f:
-        with zipfile.ZipFile(f) as zip_file:
-            # Check if the JSON file exists in the zip
-            if json_filename not in zip_file.namelist():
-                print(f"Did not find {json_filename}")
-                return {}
-
-            # Read and parse the JSON file
-            with zip_file.open(json_filename) as json_file:
-                return json.load(json_file)
+    # Read the whole entry and parse it in one go. Reading a missing entry raises
+    # KeyError, which is a dict lookup rather than a scan of namelist().
+    try:
+        data = _open_jsondata_zip().read(json_filename)
+    except KeyError:
+        print(f"Did not find {json_filename}")
+        return _NO_SENSES
+    return orjson.loads(data) if orjson else json.loads(data)
 
 
 def try_lookup_with_endings(
@@ -131,25 +153,19 @@ def try_lookup_with_endings(
     Returns:
         Tuple of (lookup_word, article_id) if found, (None, None) otherwise
     """
-    # List of common Esperanto endings to try
-    endings = ["", "i", "o", "a", "e", "as", "is", "os", "us", "u", "n", "j", "jn"]
-
-    # First try exact match
-    if base_word in kap_dict:
-        return base_word, kap_dict[base_word]
-
-    # Try with different endings
-    for ending in endings:
+    # Try with different endings. The first ending is "", the exact match.
+    for ending in _LOOKUP_ENDINGS:
         lookup = base_word + ending
-        if lookup in kap_dict:
-            return lookup, kap_dict[lookup]
+        article_id = kap_dict.get(lookup)
+        if article_id is not None:
+            return lookup, article_id
 
     return None, None
 
 
-def lookup_word_definitions(
+def _find_definitions(
     word: str, cored: CoredWord, kap_dict: dict[str, str], rad_dict: dict[str, str]
-) -> dict[str, Any]:
+) -> LookupResult:
     """Look up definitions for a word using multiple strategies.
 
     Strategy:
@@ -164,32 +180,22 @@ def lookup_word_definitions(
         rad_dict: The rad dictionary
 
     Returns:
-        Dictionary with lookup results and definitions
+        LookupResult with the definitions found, if any
     """
-    result: dict[str, Any] = {
-        "found": False,
-        "lookup_method": None,
-        "lookup_word": None,
-        "article_id": None,
-        "definitions": {},
-    }
-
-    article_id: str | None = None
-
     # Strategy 1: Try exact word match
-    if word in kap_dict:
-        article_id = kap_dict[word]
+    article_id: str | None = kap_dict.get(word)
+    if article_id is not None:
         senses = load_senses(article_id)
         if word in senses:
-            result["found"] = True
-            result["lookup_method"] = "exact"
-            result["lookup_word"] = word
-            result["article_id"] = article_id
-            # Use consistent structure: core -> {lookup_word -> definitions}
             # For non-compound words, core is single element
             core_word = cored.core[0] if len(cored.core) == 1 else word
-            result["definitions"] = {core_word: {word: senses[word]}}
-            return result
+            return LookupResult(
+                found=True,
+                lookup_method="exact",
+                lookup_word=word,
+                article_id=article_id,
+                definitions=[Definition(core_word, word, senses[word])],
+            )
 
     # Strategy 2: Try reconstructed word with different endings
     # Reconstruct: prefixes + core + suffixes (without ending)
@@ -198,66 +204,64 @@ def lookup_word_definitions(
     if lookup_word and article_id:
         senses = load_senses(article_id)
         if lookup_word in senses:
-            result["found"] = True
-            result["lookup_method"] = "with_ending"
-            result["lookup_word"] = lookup_word
-            result["article_id"] = article_id
-            # Use consistent structure: core -> {lookup_word -> definitions}
-            core_word = "|".join(cored.core)
-            result["definitions"] = {core_word: {lookup_word: senses[lookup_word]}}
-            return result
+            return LookupResult(
+                found=True,
+                lookup_method="with_ending",
+                lookup_word=lookup_word,
+                article_id=article_id,
+                definitions=[
+                    Definition("|".join(cored.core), lookup_word, senses[lookup_word])
+                ],
+            )
 
     # Strategy 2.5: Try progressively stripping suffixes
     # For words like "ĉirkaŭparolado" (ĉirkaŭ+parol+ad+o), try:
     # - ĉirkaŭparolad + endings (fails)
     # - ĉirkaŭparol + endings (should find "ĉirkaŭparoli")
     if cored.suffixes:
-        # Try removing suffixes one at a time from the end
-        for i in range(len(cored.suffixes) - 1, -1, -1):
-            # Reconstruct with fewer suffixes
-            partial_suffixes = cored.suffixes[:i]
-            partial_base = (
-                "".join(cored.prefixes)
-                + "".join(cored.core)
-                + "".join(partial_suffixes)
-            )
+        # Try removing suffixes one at a time from the end, by trimming them off the
+        # base word rather than rebuilding it each time
+        partial_base = base_word
+        for suffix in reversed(cored.suffixes):
+            partial_base = partial_base[: len(partial_base) - len(suffix)]
 
             lookup_word, article_id = try_lookup_with_endings(partial_base, kap_dict)
             if lookup_word and article_id:
                 senses = load_senses(article_id)
                 if lookup_word in senses:
-                    result["found"] = True
-                    result["lookup_method"] = "suffix_stripped"
-                    result["lookup_word"] = lookup_word
-                    result["article_id"] = article_id
-                    # Use consistent structure: core -> {lookup_word -> definitions}
-                    core_word = "|".join(cored.core)
-                    result["definitions"] = {
-                        core_word: {lookup_word: senses[lookup_word]}
-                    }
-                    return result
+                    return LookupResult(
+                        found=True,
+                        lookup_method="suffix_stripped",
+                        lookup_word=lookup_word,
+                        article_id=article_id,
+                        definitions=[
+                            Definition(
+                                "|".join(cored.core), lookup_word, senses[lookup_word]
+                            )
+                        ],
+                    )
 
     # Strategy 3: Try looking up cores
-    # For compound words, we have multiple cores
-    core_definitions: dict[str, dict[str, dict[str, str]]] = {}
+    # For compound words, we have multiple cores. A core that repeats is only
+    # defined once.
+    core_definitions: dict[str, Definition] = {}
 
     for core_part in cored.core:
         # Skip single-letter linking vowels
-        if len(core_part) == 1 and core_part in "aeio":
+        if core_part in _LINKING_VOWELS:
             continue
 
         # Check if core is in rad_dict
         if core_part in rad_dict:
             # First, try with the preferred ending from the original word
             core_with_ending = core_part + cored.preferred_ending
-            if core_with_ending in kap_dict:
-                article_id = kap_dict[core_with_ending]
+            article_id = kap_dict.get(core_with_ending)
+            if article_id is not None:
                 senses = load_senses(article_id)
                 if core_with_ending in senses:
-                    # Structure: core -> {lookup_word -> {sense_num -> definition}}
-                    core_definitions[core_part] = {
-                        core_with_ending: senses[core_with_ending]
-                    }
+                    core_definitions[core_part] = Definition(
+                        core_part, core_with_ending, senses[core_with_ending]
+                    )
                     continue
 
             # If not found with preferred ending, try other endings
@@ -265,17 +269,55 @@ def lookup_word_definitions(
             if core_lookup and core_article_id:
                 senses = load_senses(core_article_id)
                 if core_lookup in senses:
-                    # Structure: core -> {lookup_word -> {sense_num -> definition}}
-                    core_definitions[core_part] = {core_lookup: senses[core_lookup]}
+                    core_definitions[core_part] = Definition(
+                        core_part, core_lookup, senses[core_lookup]
+                    )
 
     if core_definitions:
-        result["found"] = True
-        result["lookup_method"] = "core"
-        result["lookup_word"] = "|".join(cored.core)
-        result["definitions"] = core_definitions
-        return result
+        return LookupResult(
+            found=True,
+            lookup_method="core",
+            lookup_word="|".join(cored.core),
+            article_id=None,
+            definitions=list(core_definitions.values()),
+        )
+
+    return LookupResult(
+        found=False,
+        lookup_method=None,
+        lookup_word=None,
+        article_id=None,
+        definitions=[],
+    )
 
-    return result
+
+def lookup_word_definitions(
+    word: str, cored: CoredWord, kap_dict: dict[str, str], rad_dict: dict[str, str]
+) -> dict[str, Any]:
+    """Look up definitions for a word using multiple strategies.
+
+    See _find_definitions for the strategies tried.
+
+    Args:
+        word: The original word
+        cored: The stemmed word analysis
+        kap_dict: The kap dictionary
+        rad_dict: The rad dictionary
+
+    Returns:
+        Dictionary with lookup results and definitions. Definitions are nested as
+        core -> {lookup_word -> {sense_num -> definition}}.
+    """
+    lookup = _find_definitions(word, cored, kap_dict, rad_dict)
+    return {
+        "found": lookup.found,
+        "lookup_method": lookup.lookup_method,
+        "lookup_word": lookup.lookup_word,
+        "article_id": lookup.article_id,
+        "definitions": {
+            d.core_word: {d.lookup_word: d.senses} for d in lookup.definitions
+        },
+    }
 
 
 def lookup_word_to_dict(
@@ -314,36 +356,129 @@ def lookup_word_to_dict(
     return result
 
 
-def lookup_words(words: str) -> list[dict[str, Any]]:
-    _words: list[str] = []
+@functools.cache
+def _get_stemmer() -> eostem.Stemmer:
+    """Returns a Stemmer shared by all lookups, so its caches carry over.
+
+    The Stemmer lives as long as the process (e.g. the MCP server). That is safe
+    because its per-word caches are bounded: see _CORE_WORD_CACHE_SIZE and
+    _COMPOUND_CACHE_SIZE in glosilo.eostem.
+    """
+    return eostem.Stemmer()
+
+
+def split_words(words: str) -> list[str]:
+    """Split a query into words, stripping punctuation.
+
+    This allows quoted strings like "unu du tri, kvar?"
+
+    Args:
+        words: The query text
 
-    # Split the argument into words and strip punctuation
-    # This allows quoted strings like "unu du tri, kvar?"
+    Returns:
+        The non-empty words, in order
+    """
+    _words: list[str] = []
     for token in words.split():
         # Remove punctuation from the token
         word = token.strip(string.punctuation)
         if word:  # Only add non-empty words
             _words.append(word)
+    return _words
 
+
+def lookup_words(words: str) -> list[dict[str, Any]]:
+    """Look up every word in a query.
+
+    Args:
+        words: The query text
+
+    Returns:
+        One lookup_word_to_dict result per word, in order. Repeats of a word share
+        the same result, so treat the results as read-only.
+    """
+    _words = split_words(words)
     if not _words:
         return []
 
-    # Initialize stemmer
-    stemmer = eostem.Stemmer()
+    stemmer = _get_stemmer()
 
     # Load dictionaries
     kap_dict = stemmer.get_kap_dictionary()
     rad_dict = stemmer.get_rad_dictionary()
 
-    # Look up each word
+    # Look up each distinct word once; running text repeats words a lot.
+    seen: dict[str, dict[str, Any]] = {}
     results: list[dict[str, Any]] = []
     for word in _words:
-        word_result = lookup_word_to_dict(stemmer, word, kap_dict, rad_dict)
+        word_result = seen.get(word)
+        if word_result is None:
+            word_result = lookup_word_to_dict(stemmer, word, kap_dict, rad_dict)
+            seen[word] = word_result
         results.append(word_result)
 
     return results
 
 
+def lookup_words_as_results(words: str) -> Results:
+    """Look up words straight into a Results dataclass.
+
+    Equivalent to convert_to_results(lookup_words(words)), without building the
+    intermediate per-word and per-definition dictionaries. As in lookup_words,
+    repeats of a word share the same Result.
+
+    Args:
+        words: The query text
+
+    Returns:
+        Results dataclass instance containing list of Result objects
+    """
+    stemmer = _get_stemmer()
+    kap_dict = stemmer.get_kap_dictionary()
+    rad_dict = stemmer.get_rad_dictionary()
+
+    seen: dict[str, Result] = {}
+    result_list: list[Result] = []
+    for word in split_words(words):
+        result = seen.get(word)
+        if result is None:
+            cored = stemmer.core_word(word, debug=False)
+            result = Result(
+                word=cored.orig_word,
+                prefixes=cored.prefixes,
+                core=cored.core,
+                suffixes=cored.suffixes,
+                ending=cored.preferred_ending,
+                lookup=_find_definitions(word, cored, kap_dict, rad_dict),
+            )
+            seen[word] = result
+        result_list.append(result)
+
+    return Results(results=result_list)
+
+
+def _to_lookup_result(lookup_dict: dict[str, Any]) -> LookupResult:
+    """Convert lookup_word_definitions output to a LookupResult dataclass."""
+    # Convert definitions from nested dict to list of Definition objects
+    definitions: list[Definition] = []
+    defs_dict = lookup_dict["definitions"]
+
+    # Iterate through the nested structure: core -> lookup_word -> senses
+    for core_word, lookup_words_dict in defs_dict.items():
+        for lookup_word, senses in lookup_words_dict.items():
+            definitions.append(
+                Definition(core_word=core_word, lookup_word=lookup_word, senses=senses)
+            )
+
+    return LookupResult(
+        found=lookup_dict["found"],
+        lookup_method=lookup_dict["lookup_method"],
+        lookup_word=lookup_dict["lookup_word"],
+        article_id=lookup_dict["article_id"],
+        definitions=definitions,
+    )
+
+
 def convert_to_results(lookup_data: list[dict[str, Any]]) -> Results:
     """Convert lookup_words output to a Results dataclass.
 
@@ -356,39 +491,13 @@ def convert_to_results(lookup_data: list[dict[str, Any]]) -> Results:
     result_list: list[Result] = []
 
     for item in lookup_data:
-        # Extract lookup data
-        lookup_dict = item["lookup"]
-
-        # Convert definitions from nested dict to list of Definition objects
-        definitions: list[Definition] = []
-        defs_dict = lookup_dict["definitions"]
-
-        # Iterate through the nested structure: core -> lookup_word -> senses
-        for core_word, lookup_words_dict in defs_dict.items():
-            for lookup_word, senses in lookup_words_dict.items():
-                definitions.append(
-                    Definition(
-                        core_word=core_word, lookup_word=lookup_word, senses=senses
-                    )
-                )
-
-        # Create LookupResult
-        lookup_result = LookupResult(
-            found=lookup_dict["found"],
-            lookup_method=lookup_dict["lookup_method"],
-            lookup_word=lookup_dict["lookup_word"],
-            article_id=lookup_dict["article_id"],
-            definitions=definitions,
-        )
-
-        # Create Result
         result = Result(
             word=item["word"],
             prefixes=item["prefixes"],
             core=item["core"],
             suffixes=item["suffixes"],
             ending=item["ending"],
-            lookup=lookup_result,
+            lookup=_to_lookup_result(item["lookup"]),
         )
 
         result_list.append(result)
@@ -398,10 +507,6 @@ def convert_to_results(lookup_data: list[dict[str, Any]]) -> Results:
 
 def main() -> None:
     """Main entry point for the lookup command."""
-    # Ensure UTF-8 encoding for output on Windows
-    if sys.stdout.encoding != "utf-8":
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
-
     if len(sys.argv) != 2:
         print(
             "Usage: python -m glosilo.lookup <words>",
@@ -412,7 +517,7 @@ def main() -> None:
         print('  python -m glosilo.lookup "unu du bonfaras, kie?"', file=sys.stderr)
         sys.exit(1)
 
-    print(json.dumps(lookup_words(sys.argv[1]), ensure_ascii=False, indent=2))
+    jsonout.print_json(lookup_words(sys.argv[1]))
 
 
 if __name__ == "__main__":
@@ -63,7 +63,7 @@ def eo_lookup(words: str) -> lookup.Results:
         >>> eo_lookup("mi parolas Esperanton")
         # Returns analysis for three words: "mi", "parolas", "Esperanton"
     """
-    return lookup.convert_to_results(lookup.lookup_words(words))
+    return lookup.lookup_words_as_results(words)
 
 
 if __name__ == "__main__":
@@ -10,9 +10,9 @@ Usage:
 
 import sys
 import io
-import json
 import string
 from glosilo import eostem
+from glosilo import jsonout
 from glosilo.structs import CoredWord
 
 
@@ -43,29 +43,20 @@ def verify_stem(
     # First try: core + ending (without suffixes)
     # This handles most normal words like "paroli", "kompreni"
     core_str = stemmer.core_to_str(cored.core)
-    lookup_word = (
-        core_str + cored.preferred_ending if cored.preferred_ending else core_str
-    )
-    found = lookup_word in dictionary
-
-    if not found:
-        capitalized = lookup_word.capitalize()
-        found = capitalized in dictionary
+    lookup_word = core_str + cored.preferred_ending
+    found = lookup_word in dictionary or lookup_word.capitalize() in dictionary
 
     # Second try: core + suffixes + ending
     # This handles words where the core is a preposition used as a root,
     # like "subigi" (sub+ig+i) or "forigi" (for+ig+i)
     if not found and cored.suffixes:
-        lookup_word_with_suffixes = stemmer.core_to_str(cored.core) + "".join(
-            cored.suffixes
+        lookup_word_with_suffixes = (
+            core_str + "".join(cored.suffixes) + cored.preferred_ending
+        )
+        found = (
+            lookup_word_with_suffixes in dictionary
+            or lookup_word_with_suffixes.capitalize() in dictionary
         )
-        if cored.preferred_ending:
-            lookup_word_with_suffixes += cored.preferred_ending
-
-        found = lookup_word_with_suffixes in dictionary
-        if not found:
-            capitalized = lookup_word_with_suffixes.capitalize()
-            found = capitalized in dictionary
 
         # If found with suffixes, use that as the lookup word
         if found:
@@ -93,6 +84,7 @@ def cored_word_to_dict(
     verify: bool = False,
     dictionary: dict[str, str] | None = None,
     rad_dictionary: dict[str, str] | None = None,
+    verification: tuple[bool, str] | None = None,
 ) -> dict[str, str | list[str] | dict[str, str | bool]]:
     """Convert a CoredWord to a dictionary for JSON serialization.
 
@@ -102,6 +94,7 @@ def cored_word_to_dict(
         verify: Whether to include verification information
         dictionary: Dictionary for verification
         rad_dictionary: Rad dictionary for verification
+        verification: Result of verify_stem, if already computed
 
     Returns:
         Dictionary with word analysis
@@ -116,7 +109,9 @@ def cored_word_to_dict(
 
     # Add verification result if requested
     if verify and dictionary is not None:
-        found, lookup_word = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+        if verification is None:
+            verification = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+        found, lookup_word = verification
         result["verification"] = {
             "found": found,
             "lookup_word": lookup_word,
@@ -131,11 +126,15 @@ def format_cored_word(
     verify: bool = False,
     dictionary: dict[str, str] | None = None,
     rad_dictionary: dict[str, str] | None = None,
+    verification: tuple[bool, str] | None = None,
 ) -> str:
     """Format a CoredWord for display as a one-line output.
 
     Format: word = prefix+core+suffix+ending [lookup: word | FOUND/NOT FOUND]
 
+    If verify_stem was already run for this word, pass its result as verification
+    so it is not run again.
+
     Examples:
         parolanto = parol+ant+i
         nekompreneble = ne+kompren+ebl+i [lookup: kompreni | FOUND]
@@ -157,7 +156,9 @@ def format_cored_word(
 
     # Add verification result if requested
     if verify and dictionary is not None:
-        found, lookup_word = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+        if verification is None:
+            verification = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+        found, lookup_word = verification
         status = "FOUND" if found else "NOT FOUND"
         result += f" [lookup: {lookup_word} | {status}]"
 
@@ -206,6 +207,7 @@ def main() -> None:
     words: list[str] = []
 
     # Parse arguments
+    punctuation = string.punctuation
     for arg in sys.argv[1:]:
         if arg == "--debug":
             debug = True
@@ -218,7 +220,7 @@ def main() -> None:
             # This allows quoted strings like "unu du tri, kvar?"
             for token in arg.split():
                 # Remove punctuation from the token
-                word = token.strip(string.punctuation)
+                word = token.strip(punctuation)
                 if word:  # Only add non-empty words
                     words.append(word)
 
@@ -239,14 +241,14 @@ def main() -> None:
     if json_output:
         # JSON output mode: collect all results and output as array
         results: list[dict[str, str | list[str] | dict[str, str | bool]]] = []
-        for word in words:
-            cored = stemmer.core_word(word, debug=False)  # No debug in JSON mode
+        for cored in stemmer.core_words(words):  # No debug in JSON mode
 
             # When verifying, only include words that are NOT FOUND
+            verification: tuple[bool, str] | None = None
             if verify:
                 assert dictionary is not None
-                found, _ = verify_stem(stemmer, cored, dictionary, rad_dictionary)
-                if found:
+                verification = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+                if verification[0]:
                     continue  # Skip words that are found
 
             results.append(
@@ -256,21 +258,23 @@ def main() -> None:
                     verify=verify,
                     dictionary=dictionary,
                     rad_dictionary=rad_dictionary,
+                    verification=verification,
                 )
             )
 
         # Output JSON with no other text
-        print(json.dumps(results, ensure_ascii=False, indent=2))
+        jsonout.print_json(results)
     else:
         # Normal text output mode
         for word in words:
             cored = stemmer.core_word(word, debug=debug)
 
             # When verifying, only show words that are NOT FOUND
+            verification = None
             if verify:
                 assert dictionary is not None
-                found, _ = verify_stem(stemmer, cored, dictionary, rad_dictionary)
-                if found:
+                verification = verify_stem(stemmer, cored, dictionary, rad_dictionary)
+                if verification[0]:
                     continue  # Skip words that are found
 
             # Print results
@@ -283,6 +287,7 @@ def main() -> None:
                     verify=verify,
                     dictionary=dictionary,
                     rad_dictionary=rad_dictionary,
+                    verification=verification,
                 )
             )
 
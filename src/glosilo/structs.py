@@ -24,10 +24,13 @@ class AnalyzedDefinition:
     suffixes: list[str]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CoredWord:
     """A cored word."""
 
+    # One of these is created per stemmed word, hence slots. Not frozen: the glosser
+    # and dictionary fill in the definition fields after stemming.
+
     orig_word: str
     prefixes: list[str]
     # The core of a word is the part that is left after all prefixes and suffixes
@@ -43,10 +46,8 @@ class CoredWord:
     parts: list[CoredWord] = dataclasses.field(default_factory=list)
 
     def __str__(self) -> str:
-        from glosilo.eostem import core_display
-
         parts = ", ".join(str(part) for part in self.parts)
-        core_str = core_display(self.core)
+        core_str = "|".join(self.core)
         return (
             f"{self.orig_word} = {self.prefixes}+{core_str}({self.core_definition})"
             f"+{self.suffixes}+{self.preferred_ending} = {self.preferred_definition} "
@@ -10,6 +10,8 @@ from unittest.mock import MagicMock, Mock, patch, mock_open
 
 import pytest
 
+from glosilo import eostem
+from glosilo import lookup
 from glosilo.lookup import (
     Definition,
     LookupResult,
@@ -19,13 +21,30 @@ from glosilo.lookup import (
     lookup_word_definitions,
     lookup_word_to_dict,
     lookup_words,
+    lookup_words_as_results,
     convert_to_results,
-    load_kap_dictionary,
+    split_words,
     load_senses,
 )
 from glosilo.structs import CoredWord
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Keep mocked senses, zip files, dictionaries and stemmers from leaking."""
+    caches = (
+        load_senses,
+        lookup._open_jsondata_zip,
+        lookup._get_stemmer,
+        eostem._load_dictionary,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    for cache in caches:
+        cache.cache_clear()
+
+
 class TestDataclasses:
     """Test the dataclass structures."""
 
@@ -155,22 +174,28 @@ class TestTryLookupWithEndings:
 
 
 class TestLoadKapDictionary:
-    """Test the load_kap_dictionary function."""
+    """Test loading the kap dictionary with eostem._load_dictionary."""
 
-    def test_load_existing_file(self):
+    @patch("glosilo.eostem.files")
+    def test_load_existing_file(self, mock_files):
         """Test loading an existing kap_dictionary.json file."""
         mock_data = {"paroli": "parol", "esti": "est"}
+        mock_file = mock_files.return_value.joinpath.return_value
+        mock_file.read_bytes.return_value = json.dumps(mock_data).encode("utf-8")
+
+        result = eostem._load_dictionary(eostem.KAP_DICTIONARY_FILE)
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=json.dumps(mock_data))):
-                result = load_kap_dictionary()
-                assert result == mock_data
+        assert result == mock_data
+        mock_files.return_value.joinpath.assert_called_once_with("kap_dictionary.json")
 
-    def test_file_not_exists(self):
+    @patch("glosilo.eostem.files")
+    def test_file_not_exists(self, mock_files):
         """Test when kap_dictionary.json does not exist."""
-        with patch("pathlib.Path.exists", return_value=False):
-            result = load_kap_dictionary()
-            assert result == {}
+        mock_file = mock_files.return_value.joinpath.return_value
+        mock_file.read_bytes.side_effect = FileNotFoundError
+
+        with pytest.raises(FileNotFoundError):
+            eostem._load_dictionary(eostem.KAP_DICTIONARY_FILE)
 
 
 class TestLoadSensesFromXml:
@@ -184,15 +209,25 @@ class TestLoadSensesFromXml:
 
         # Mock the zip file operations
         mock_zip = MagicMock()
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-        mock_zip.namelist.return_value = ["parol.json"]
-        mock_zip.open.return_value.__enter__.return_value = io.BytesIO(
-            json.dumps(mock_senses).encode('utf-8')
-        )
+        mock_zipfile.return_value = mock_zip
+        mock_zip.read.return_value = json.dumps(mock_senses).encode('utf-8')
 
         result = load_senses("parol")
         assert result == mock_senses
 
+    @patch("zipfile.ZipFile")
+    def test_reads_zip_once(self, mock_zipfile):
+        """Test that the zip is opened, and an article read, only once."""
+        mock_zip = mock_zipfile.return_value
+        mock_zip.read.return_value = b'{"paroli": {"1": "to speak"}}'
+
+        first = load_senses("parol")
+        second = load_senses("parol")
+
+        assert first == second == {"paroli": {"1": "to speak"}}
+        assert mock_zip.read.call_count == 1
+        assert mock_zipfile.call_count == 1
+
     @patch("pathlib.Path.exists", return_value=False)
     def test_xml_not_exists(self, mock_exists):
         """Test when zip file does not exist."""
@@ -202,9 +237,9 @@ class TestLoadSensesFromXml:
     @patch("zipfile.ZipFile", side_effect=Exception("Zip error"))
     @patch("pathlib.Path.exists", return_value=True)
     def test_exception_handling(self, mock_exists, mock_zipfile):
-        """Test exception handling when loading from zip fails."""
-        result = load_senses("parol")
-        assert result == {}
+        """Test that errors opening the zip are not swallowed."""
+        with pytest.raises(Exception, match="Zip error"):
+            load_senses("parol")
 
 
 class TestLookupWordDefinitions:
@@ -226,7 +261,7 @@ class TestLookupWordDefinitions:
         kap_dict = {"paroli": "parol"}
         rad_dict = {"parol": "parol"}
 
-        with patch("glosilo.lookup.load_senses_from_xml") as mock_load:
+        with patch("glosilo.lookup.load_senses") as mock_load:
             mock_load.return_value = {"paroli": {"1": "to speak", "2": "to talk"}}
 
             result = lookup_word_definitions(word, cored, kap_dict, rad_dict)
@@ -254,7 +289,7 @@ class TestLookupWordDefinitions:
         kap_dict = {"parolanti": "parol"}
         rad_dict = {"parol": "parol"}
 
-        with patch("glosilo.lookup.load_senses_from_xml") as mock_load:
+        with patch("glosilo.lookup.load_senses") as mock_load:
             mock_load.return_value = {"parolanti": {"1": "speaker (one who speaks)"}}
 
             result = lookup_word_definitions(word, cored, kap_dict, rad_dict)
@@ -278,7 +313,7 @@ class TestLookupWordDefinitions:
         kap_dict = {"paroli": "parol"}
         rad_dict = {"parol": "parol"}
 
-        with patch("glosilo.lookup.load_senses_from_xml") as mock_load:
+        with patch("glosilo.lookup.load_senses") as mock_load:
             mock_load.return_value = {"paroli": {"1": "to speak"}}
 
             result = lookup_word_definitions(word, cored, kap_dict, rad_dict)
@@ -307,7 +342,7 @@ class TestLookupWordDefinitions:
         kap_dict = {"testi": "test"}
         rad_dict = {"test": "test"}
 
-        with patch("glosilo.lookup.load_senses_from_xml") as mock_load:
+        with patch("glosilo.lookup.load_senses") as mock_load:
             mock_load.return_value = {"testi": {"1": "to test"}}
 
             result = lookup_word_definitions(word, cored, kap_dict, rad_dict)
@@ -332,7 +367,7 @@ class TestLookupWordDefinitions:
         kap_dict = {"vorto": "vort", "aro": "ar"}
         rad_dict = {"vort": "vort", "ar": "ar"}
 
-        with patch("glosilo.lookup.load_senses_from_xml") as mock_load:
+        with patch("glosilo.lookup.load_senses") as mock_load:
 
             def load_senses_side_effect(article_id):
                 if article_id == "vort":
@@ -420,14 +455,13 @@ class TestLookupWords:
     """Test the lookup_words function."""
 
     @patch("glosilo.lookup.lookup_word_to_dict")
-    @patch("glosilo.lookup.load_kap_dictionary")
     @patch("glosilo.eostem.Stemmer")
-    def test_single_word(self, mock_stemmer_class, mock_load_kap, mock_lookup_word):
+    def test_single_word(self, mock_stemmer_class, mock_lookup_word):
         """Test looking up a single word."""
         mock_stemmer = Mock()
         mock_stemmer.get_rad_dictionary.return_value = {}
         mock_stemmer_class.return_value = mock_stemmer
-        mock_load_kap.return_value = {}
+        mock_stemmer.get_kap_dictionary.return_value = {}
 
         mock_lookup_word.return_value = {
             "word": "paroli",
@@ -444,14 +478,13 @@ class TestLookupWords:
         assert result[0]["word"] == "paroli"
 
     @patch("glosilo.lookup.lookup_word_to_dict")
-    @patch("glosilo.lookup.load_kap_dictionary")
     @patch("glosilo.eostem.Stemmer")
-    def test_multiple_words(self, mock_stemmer_class, mock_load_kap, mock_lookup_word):
+    def test_multiple_words(self, mock_stemmer_class, mock_lookup_word):
         """Test looking up multiple words."""
         mock_stemmer = Mock()
         mock_stemmer.get_rad_dictionary.return_value = {}
         mock_stemmer_class.return_value = mock_stemmer
-        mock_load_kap.return_value = {}
+        mock_stemmer.get_kap_dictionary.return_value = {}
 
         def mock_lookup_side_effect(stemmer, word, kap_dict, rad_dict):
             return {
@@ -472,16 +505,13 @@ class TestLookupWords:
         assert result[1]["word"] == "esti"
 
     @patch("glosilo.lookup.lookup_word_to_dict")
-    @patch("glosilo.lookup.load_kap_dictionary")
     @patch("glosilo.eostem.Stemmer")
-    def test_punctuation_stripping(
-        self, mock_stemmer_class, mock_load_kap, mock_lookup_word
-    ):
+    def test_punctuation_stripping(self, mock_stemmer_class, mock_lookup_word):
         """Test that punctuation is stripped from words."""
         mock_stemmer = Mock()
         mock_stemmer.get_rad_dictionary.return_value = {}
         mock_stemmer_class.return_value = mock_stemmer
-        mock_load_kap.return_value = {}
+        mock_stemmer.get_kap_dictionary.return_value = {}
 
         mock_lookup_word.return_value = {
             "word": "paroli",
@@ -500,6 +530,25 @@ class TestLookupWords:
         assert calls[0][0][1] == "paroli"
         assert calls[1][0][1] == "esti"
 
+    @patch("glosilo.lookup.lookup_word_to_dict")
+    @patch("glosilo.eostem.Stemmer")
+    def test_repeated_words(self, mock_stemmer_class, mock_lookup_word):
+        """Test that a repeated word is looked up once and shares its result."""
+        mock_stemmer = Mock()
+        mock_stemmer.get_rad_dictionary.return_value = {}
+        mock_stemmer_class.return_value = mock_stemmer
+        mock_stemmer.get_kap_dictionary.return_value = {}
+
+        mock_lookup_word.side_effect = lambda stemmer, word, kap_dict, rad_dict: {
+            "word": word
+        }
+
+        result = lookup_words("paroli paroli esti")
+
+        assert mock_lookup_word.call_count == 2
+        assert [r["word"] for r in result] == ["paroli", "paroli", "esti"]
+        assert result[0] is result[1]
+
     @patch("glosilo.eostem.Stemmer")
     def test_empty_input(self, mock_stemmer_class):
         """Test with empty input."""
@@ -513,6 +562,22 @@ class TestLookupWords:
         assert result == []
 
 
+class TestSplitWords:
+    """Test the split_words function."""
+
+    def test_strips_punctuation(self):
+        """Test that punctuation is stripped from each word."""
+        assert split_words('unu du tri, "kvar?"') == ["unu", "du", "tri", "kvar"]
+
+    def test_drops_punctuation_only_tokens(self):
+        """Test that tokens made only of punctuation are dropped."""
+        assert split_words("unu -- du ... !!!") == ["unu", "du"]
+
+    def test_empty_input(self):
+        """Test with empty input."""
+        assert split_words("") == []
+
+
 class TestConvertToResults:
     """Test the convert_to_results function."""
 
@@ -657,5 +722,24 @@ class TestConvertToResults:
         assert len(results.results[0].lookup.definitions) == 0
 
 
+class TestLookupWordsAsResults:
+    """Test the lookup_words_as_results function."""
+
+    @patch("glosilo.lookup.load_senses")
+    def test_matches_convert_to_results(self, mock_load):
+        """Test that it matches convert_to_results(lookup_words(...))."""
+        mock_load.side_effect = lambda article_id: {
+            article_id + "i": {"1": f"{article_id} (verb)"},
+            article_id + "o": {"1": f"{article_id} (noun)"},
+        }
+        words = "Mi volas paroli kun la vortaristo, kaj paroli bonfaras! xyzabc"
+
+        assert lookup_words_as_results(words) == convert_to_results(lookup_words(words))
+
+    def test_empty_input(self):
+        """Test with empty input."""
+        assert lookup_words_as_results("... !!!") == Results(results=[])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,7 +3,7 @@ import pytest
 from glosilo import eostem
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stemmer() -> eostem.Stemmer:
     return eostem.Stemmer()
 
@@ -118,5 +118,55 @@ def test_dezert_not_split_as_preposition(stemmer: eostem.Stemmer):
     assert suffixes == []
 
 
+def test_compound_penalty_outranks_root_length(stemmer: eostem.Stemmer):
+    """Test that 'fermil' is ferm+il, not the longer-rooted compound fer|mil."""
+    core, prefixes, suffixes = stemmer._strip_affixes2("fermil")
+    # fer|mil reconstructs a longer root, but compounds are penalized and
+    # penalty is ranked before root length.
+    assert prefixes == []
+    assert core == ["ferm"]
+    assert suffixes == ["il"]
+
+
+def test_strip_prefixes_and_suffixes_keep_word_order(stemmer: eostem.Stemmer):
+    """Test that the affix strippers return affixes in the order they appear."""
+    assert stemmer._strip_prefixes("malneboneg") == ("boneg", ["mal", "ne"])
+    assert stemmer._strip_suffixes("lernejestr") == ("lernejestr", [])
+    assert stemmer._strip_suffixes("sanulejet") == ("san", ["ul", "ej", "et"])
+
+
+def test_core_word_cache_returns_independent_results(stemmer: eostem.Stemmer):
+    """Test that a memoized core_word result can be mutated without affecting others."""
+    first = stemmer.core_word("Malsanulejo")
+    first.suffixes.append("et")
+    first.definitions.append("hospital")
+    second = stemmer.core_word("malsanulejo")
+    assert second.orig_word == "malsanulejo"
+    assert second.prefixes == ["mal"]
+    assert second.core == ["san"]
+    assert second.suffixes == ["ul", "ej"]
+    assert second.definitions == []
+
+
+def test_compound_cache_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    """Test that the compound cache is cleared instead of growing past its size."""
+    monkeypatch.setattr(eostem, "_COMPOUND_CACHE_SIZE", 2)
+    stemmer = eostem.Stemmer()
+    for word in ("bonhumor", "vaporŝip", "multehom"):
+        stemmer._try_split_compound(word)
+        assert len(stemmer._compound_cache) <= 2
+    assert stemmer._try_split_compound("bonhumor") == ["bon", "humor"]
+
+
+def test_core_word_cache_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    """Test that the core_word cache is cleared instead of growing past its size."""
+    monkeypatch.setattr(eostem, "_CORE_WORD_CACHE_SIZE", 2)
+    stemmer = eostem.Stemmer()
+    for word in ("parolanto", "malsanulejo", "bonfaras"):
+        stemmer.core_word(word)
+        assert len(stemmer._core_word_cache) <= 2
+    assert stemmer.core_word("parolanto").core == ["parol"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])